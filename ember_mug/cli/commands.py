@@ -38,6 +38,8 @@ async def get_device(args: Namespace) -> EmberMug:
         get_model_info_from_advertiser_data(advertisement),
         use_metric=not args.imperial,
         debug=args.debug,
+        # One-shot commands exit the loop right away, so disconnect on context exit
+        keep_alive=0,
     )
     if not args.raw:
         print("Connecting...")
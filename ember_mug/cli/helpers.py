@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from argparse import ArgumentTypeError
 from collections import defaultdict
 from functools import partial
@@ -13,7 +14,7 @@ from ember_mug.data import Change
 from ember_mug.formatting import format_led_colour, format_liquid_level, format_temp
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Sequence
 
     from ember_mug.mug import EmberMug
 
@@ -62,17 +63,22 @@ def print_info(mug: EmberMug) -> None:
     print_table(list(mug.data.formatted.items()))
 
 
-def print_changes(changes: list[Change], metric: bool = True) -> None:
+def print_changes(changes: Sequence[Change], metric: bool = True) -> None:
     """Print changes."""
+    if not changes:
+        return
     formatters: dict[str, Callable] = {
         "current_temp": partial(format_temp, metric=metric),
         "target_temp": partial(format_temp, metric=metric),
         **base_formatters,
     }
+    lines: list[str] = []
     for attr, old_value, new_value in changes:
         if formatter := formatters.get(attr):
             old_value, new_value = formatter(old_value), formatter(new_value)  # noqa: PLW2901
-        print(Change(attr, old_value, new_value))
+        lines.append(str(Change(attr, old_value, new_value)))
+    # Write all changes in a single call instead of one print() per row
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 class CommandLoop:
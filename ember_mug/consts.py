@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import platform
 import re
-from enum import Enum, IntEnum
+import sys
+from enum import Enum, IntEnum, IntFlag, auto
 from functools import cached_property
 from typing import NamedTuple
 from uuid import UUID
@@ -229,6 +230,40 @@ PUSH_EVENT_BATTERY_IDS = [
     PushEvent.CHARGER_DISCONNECTED,
 ]
 
+
+class UpdateAttribute(IntFlag):
+    """Bit flags for attributes queued for an update by push events."""
+
+    BATTERY = auto()
+    TARGET_TEMP = auto()
+    CURRENT_TEMP = auto()
+    LIQUID_LEVEL = auto()
+    LIQUID_STATE = auto()
+    BATTERY_VOLTAGE = auto()
+
+    @cached_property
+    def attr(self) -> str:
+        """Get the MugData attribute name for this flag."""
+        return self.name.lower()  # type: ignore[union-attr]
+
+
+# Attribute to queue for an update when the given push event is received
+PUSH_EVENT_QUEUED_ATTRS: dict[int, UpdateAttribute] = {
+    PushEvent.BATTERY_CHANGED: UpdateAttribute.BATTERY,
+    PushEvent.CHARGER_CONNECTED: UpdateAttribute.BATTERY,
+    PushEvent.CHARGER_DISCONNECTED: UpdateAttribute.BATTERY,
+    PushEvent.TARGET_TEMPERATURE_CHANGED: UpdateAttribute.TARGET_TEMP,
+    PushEvent.DRINK_TEMPERATURE_CHANGED: UpdateAttribute.CURRENT_TEMP,
+    PushEvent.LIQUID_LEVEL_CHANGED: UpdateAttribute.LIQUID_LEVEL,
+    PushEvent.LIQUID_STATE_CHANGED: UpdateAttribute.LIQUID_STATE,
+    PushEvent.BATTERY_VOLTAGE_STATE_CHANGED: UpdateAttribute.BATTERY_VOLTAGE,
+}
+
+# Expanded to one entry per possible event byte, so classification is a single index
+PUSH_EVENT_QUEUED_ATTR_TABLE: tuple[UpdateAttribute, ...] = tuple(
+    PUSH_EVENT_QUEUED_ATTRS.get(event_id, UpdateAttribute(0)) for event_id in range(256)
+)
+
 # Labels for formatting attributes
 ATTR_LABELS = {
     "name": "Device Name",
@@ -247,6 +282,8 @@ ATTR_LABELS = {
     "battery_voltage": "Voltage",
     "volume_level": "Volume Level",
 }
+# Interned so dict lookups on the formatted view short-circuit on identity
+ATTR_LABELS = {attr: sys.intern(label) for attr, label in ATTR_LABELS.items()}
 
 # Attributes
 INITIAL_ATTRS = {
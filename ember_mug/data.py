@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import struct
 from dataclasses import asdict, dataclass, field
-from functools import cached_property
+from functools import cache, cached_property
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 from .consts import (
@@ -21,13 +22,17 @@ from .consts import (
     VolumeLevel,
 )
 from .formatting import format_led_colour, format_liquid_level, format_temp
-from .utils import bytes_to_little_int, decode_byte_string
+from .utils import decode_byte_string
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from datetime import datetime
 
     from _typeshed import DataclassInstance
 
+# Precompiled so firmware parsing skips the per-call format parse and slicing
+_FIRMWARE_STRUCT = struct.Struct("<HHH")
+
 
 class Change(NamedTuple):
     """Helper for storing changes to attributes."""
@@ -41,6 +46,10 @@ class Change(NamedTuple):
         return f'{self.attr.replace("_", " ").title()} changed from "{self.old_value}" to "{self.new_value}"'
 
 
+# Shared result for the common no-change poll
+_EMPTY_CHANGES: tuple[Change, ...] = ()
+
+
 class Colour(NamedTuple):
     """Simple helper for colour formatting."""
 
@@ -51,11 +60,13 @@ class Colour(NamedTuple):
 
     def as_hex(self) -> str:
         """Format colour array as hex string."""
-        return "#" + "".join(f"{c:02x}" for c in self)[:6]
+        # bytes.hex() is implemented in C and much faster than formatting each channel
+        return "#" + bytes((self.red, self.green, self.blue)).hex()
 
     def as_bytearray(self) -> bytearray:
         """Convert to byte array."""
-        return bytearray(c for c in self)
+        # The tuple itself is an iterable of ints, so skip the generator
+        return bytearray(self)
 
     def __str__(self) -> str:
         """For more useful cli output, format as hex."""
@@ -65,12 +76,18 @@ class Colour(NamedTuple):
 class AsDict:
     """Mixin to add as_dict to dataclass for serialization."""
 
+    __slots__ = ()
+
     def as_dict(self: DataclassInstance) -> dict[str, Any]:
         """Add as_dict to dataclass for serialization."""
         return asdict(self)
 
 
-@dataclass
+# Indexed by on_charging_base, saving a conditional per display refresh
+_CHARGE_SUFFIX = ("not on charging base", "on charging base")
+
+
+@dataclass(slots=True)
 class BatteryInfo(AsDict):
     """Battery Information."""
 
@@ -87,10 +104,10 @@ class BatteryInfo(AsDict):
 
     def __str__(self) -> str:
         """Format nicely for printing."""
-        return f'{self.percent}%, {"" if self.on_charging_base else "not "}on charging base'
+        return f"{self.percent}%, {_CHARGE_SUFFIX[self.on_charging_base]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MugFirmwareInfo(AsDict):
     """Firmware versions."""
 
@@ -101,10 +118,11 @@ class MugFirmwareInfo(AsDict):
     @classmethod
     def from_bytes(cls, data: bytes) -> MugFirmwareInfo:
         """Initialize from raw bytes."""
+        version, hardware, bootloader = _FIRMWARE_STRUCT.unpack_from(data)
         return cls(
-            version=bytes_to_little_int(data[:2]),
-            hardware=bytes_to_little_int(data[2:4]),
-            bootloader=bytes_to_little_int(data[4:]),
+            version=version,
+            hardware=hardware,
+            bootloader=bootloader,
         )
 
     def __str__(self) -> str:
@@ -129,63 +147,84 @@ class BaseModelInfo(AsDict):
     device_type: DeviceType = field(init=False)
 
 
+class _ModelSpec(NamedTuple):
+    """Static details for a model, resolved with a single dict lookup."""
+
+    name: str
+    capacity: int | None  # ml
+    device_type: DeviceType
+
+
+# Fall back to a mug, since this could be an unknown device
+_UNKNOWN_SPEC = _ModelSpec("Unknown Device", None, DeviceType.MUG)
+
+_MODEL_SPECS: dict[DeviceModel, _ModelSpec] = {
+    DeviceModel.CUP_6_OZ: _ModelSpec(DEVICE_MODEL_NAMES[DeviceModel.CUP_6_OZ], 178, DeviceType.CUP),
+    DeviceModel.MUG_1_10_OZ: _ModelSpec(DEVICE_MODEL_NAMES[DeviceModel.MUG_1_10_OZ], 295, DeviceType.MUG),
+    DeviceModel.MUG_1_14_OZ: _ModelSpec(DEVICE_MODEL_NAMES[DeviceModel.MUG_1_14_OZ], 414, DeviceType.MUG),
+    DeviceModel.MUG_2_10_OZ: _ModelSpec(DEVICE_MODEL_NAMES[DeviceModel.MUG_2_10_OZ], 295, DeviceType.MUG),
+    DeviceModel.MUG_2_14_OZ: _ModelSpec(DEVICE_MODEL_NAMES[DeviceModel.MUG_2_14_OZ], 414, DeviceType.MUG),
+    DeviceModel.TRAVEL_MUG_12_OZ: _ModelSpec(
+        DEVICE_MODEL_NAMES[DeviceModel.TRAVEL_MUG_12_OZ],
+        355,
+        DeviceType.TRAVEL_MUG,
+    ),
+    DeviceModel.TUMBLER_16_OZ: _ModelSpec(DEVICE_MODEL_NAMES[DeviceModel.TUMBLER_16_OZ], 473, DeviceType.TUMBLER),
+}
+
+
 @dataclass
 class ModelInfo(BaseModelInfo):
     """Model name and attributes based on mode."""
 
+    @cached_property
+    def _spec(self) -> _ModelSpec:
+        """Look up all static details for this model at once."""
+        if self.model is None:
+            return _UNKNOWN_SPEC
+        return _MODEL_SPECS.get(self.model, _UNKNOWN_SPEC)
+
     @cached_property  # type: ignore[misc]
     def name(self) -> str:  # type: ignore[override]
         """Get a human-readable name from model number."""
-        return DEVICE_MODEL_NAMES.get(
-            self.model or DeviceModel.UNKNOWN_DEVICE,
-            "Unknown Device",
-        )
+        return self._spec.name
 
     @cached_property  # type: ignore[misc]
     def capacity(self) -> int | None:  # type: ignore[override]
         """Determine capacity in mL based on model number."""
-        if self.model == DeviceModel.CUP_6_OZ:
-            return 178  # ml - 6oz
-        if self.model in (DeviceModel.MUG_1_10_OZ, DeviceModel.MUG_2_10_OZ):
-            return 295  # ml - 10oz
-        if self.model == DeviceModel.TRAVEL_MUG_12_OZ:
-            return 355  # ml - 12oz
-        if self.model in (DeviceModel.MUG_1_14_OZ, DeviceModel.MUG_2_14_OZ):
-            return 414  # ml - 14oz
-        if self.model == DeviceModel.TUMBLER_16_OZ:
-            return 473  # ml - 16oz
-        return None
+        return self._spec.capacity
 
     @cached_property  # type: ignore[misc]
     def device_type(self) -> DeviceType:  # type: ignore[override]
         """Basic device type from model number."""
-        if self.model == DeviceModel.TRAVEL_MUG_12_OZ:
-            return DeviceType.TRAVEL_MUG
-        if self.model == DeviceModel.TUMBLER_16_OZ:
-            return DeviceType.TUMBLER
-        if self.model == DeviceModel.CUP_6_OZ:
-            return DeviceType.CUP
-        # This could be an unknown device, but fallback to mug
-        return DeviceType.MUG
+        return self._spec.device_type
 
     @cached_property
-    def device_attributes(self) -> set[str]:
+    def device_attributes(self) -> frozenset[str]:
         """Attributes to update based on model and extra."""
-        attributes = EXTRA_ATTRS | INITIAL_ATTRS | UPDATE_ATTRS
-        unknown = (None, DeviceModel.UNKNOWN_DEVICE)
-        if self.model in unknown or self.device_type in (DeviceType.CUP, DeviceType.TUMBLER):
-            # The Cup and Tumbler cannot be named
-            attributes -= {"name"}
-        elif self.model in unknown or self.device_type == DeviceType.TRAVEL_MUG:
-            # Tge Travel Mug does not have an LED colour, but has a volume attribute
-            attributes = (attributes - {"led_colour"}) | {"volume_level"}
-        if self.model != DeviceModel.TRAVEL_MUG_12_OZ:
-            # Only Travel mug has this attribute?
-            attributes -= {"battery_voltage"}
-        return attributes
-
-
-@dataclass
+        return _device_attributes(self.model)
+
+
+@cache
+def _device_attributes(model: DeviceModel | None) -> frozenset[str]:
+    """Compute the attribute set for a model once, shared by all instances of that model."""
+    device_type = (_MODEL_SPECS.get(model, _UNKNOWN_SPEC) if model else _UNKNOWN_SPEC).device_type
+    attributes = EXTRA_ATTRS | INITIAL_ATTRS | UPDATE_ATTRS
+    unknown = (None, DeviceModel.UNKNOWN_DEVICE)
+    if model in unknown or device_type in (DeviceType.CUP, DeviceType.TUMBLER):
+        # The Cup and Tumbler cannot be named
+        attributes -= {"name"}
+    elif model in unknown or device_type == DeviceType.TRAVEL_MUG:
+        # Tge Travel Mug does not have an LED colour, but has a volume attribute
+        attributes = (attributes - {"led_colour"}) | {"volume_level"}
+    if model != DeviceModel.TRAVEL_MUG_12_OZ:
+        # Only Travel mug has this attribute?
+        attributes -= {"battery_voltage"}
+    # Frozen so the cached value cannot be mutated by callers
+    return frozenset(attributes)
+
+
+@dataclass(slots=True)
 class MugMeta(AsDict):
     """Meta data for mug."""
 
@@ -200,6 +239,10 @@ class MugMeta(AsDict):
             serial_number=data[7:].decode(),
         )
 
+    def as_dict(self) -> dict[str, Any]:
+        """Build the dict directly, skipping asdict's recursive machinery."""
+        return {"mug_id": self.mug_id, "serial_number": self.serial_number}
+
     def __str__(self) -> str:
         """Format nicely for printing."""
         return f"Mug ID: {self.mug_id}, Serial Number: {self.serial_number}"
@@ -231,6 +274,11 @@ class MugData(AsDict):
     date_time_zone: datetime | None = None
     battery_voltage: int | None = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the attribute and invalidate the cached formatted view."""
+        super().__setattr__(name, value)
+        self.__dict__.pop("_formatted_cache", None)
+
     @property
     def meta_display(self) -> str:
         """Return Meta infor based on preference."""
@@ -270,14 +318,17 @@ class MugData(AsDict):
         """Human-readable target temp with unit."""
         return format_temp(self.target_temp, self.use_metric)
 
-    def update_info(self, **kwargs: Any) -> list[Change]:
+    def update_info(self, **kwargs: Any) -> Sequence[Change]:
         """Update attributes of the mug if they haven't changed."""
-        changes: list[Change] = []
+        changes: list[Change] | None = None
         for attr, new_value in kwargs.items():
             if (old_value := getattr(self, attr)) != new_value:
                 setattr(self, attr, new_value)
+                if changes is None:
+                    changes = []
                 changes.append(Change(attr, old_value, new_value))
-        return changes
+        # Polling usually changes nothing, so skip the list allocation entirely then
+        return changes if changes is not None else _EMPTY_CHANGES
 
     def get_formatted_attr(self, attr: str) -> str | None:
         """Get the display value of a given attribute."""
@@ -288,10 +339,18 @@ class MugData(AsDict):
     @property
     def formatted(self) -> dict[str, Any]:
         """Return human-readable names and values for all attributes for display."""
+        # Keyed on the model fields too, since model_info can be mutated in place
+        model_key = (self.model_info.model, self.model_info.colour)
+        cached = self.__dict__.get("_formatted_cache")
+        if cached is not None and cached[0] == model_key:
+            return cached[1]
         all_attrs = self.model_info.device_attributes | {"use_metric"}
         if not self.debug:
             all_attrs -= EXTRA_ATTRS
-        return {label: self.get_formatted_attr(attr) for attr, label in ATTR_LABELS.items() if attr in all_attrs}
+        formatted = {label: self.get_formatted_attr(attr) for attr, label in ATTR_LABELS.items() if attr in all_attrs}
+        # Stored directly in __dict__ so it stays out of the dataclass fields and as_dict()
+        self.__dict__["_formatted_cache"] = (model_key, formatted)
+        return formatted
 
     def as_dict(self) -> dict[str, Any]:
         """Dump all attributes as dict for info/debugging."""
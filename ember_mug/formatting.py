@@ -7,11 +7,23 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .data import Colour
 
+# Multiplying is cheaper than dividing by the 30-step scale on every refresh
+_LEVEL_SCALE = 100.0 / 30.0
+
+
+def format_temp_celsius(temp: float) -> str:
+    """Format a Celsius temperature, with the unit baked into the format string."""
+    return f"{temp:.2f}°C"
+
+
+def format_temp_fahrenheit(temp: float) -> str:
+    """Format a Fahrenheit temperature, with the unit baked into the format string."""
+    return f"{temp:.2f}°F"
+
 
 def format_temp(temp: float, metric: bool = True) -> str:
     """Format temperature with the correct unit."""
-    unit = "C" if metric else "F"
-    return f"{temp:.2f}°{unit}"
+    return format_temp_celsius(temp) if metric else format_temp_fahrenheit(temp)
 
 
 def format_capacity(capacity: int | None, metric: bool = True) -> str:
@@ -32,4 +44,4 @@ def format_led_colour(led_colour: Colour) -> str:
 
 def format_liquid_level(liquid_level: int) -> str:
     """Human readable liquid level."""
-    return f"{(liquid_level / 30 * 100):.2f}%"
+    return f"{liquid_level * _LEVEL_SCALE:.2f}%"
@@ -5,25 +5,30 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import struct
 from datetime import UTC, datetime
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, lru_cache
 from time import time
 from typing import TYPE_CHECKING, Any, Concatenate, Literal, ParamSpec, TypeVar
+from weakref import WeakKeyDictionary
 
-from bleak import AdvertisementData, BleakClient, BleakError
+from bleak import BleakClient, BleakError
 from bleak_retry_connector import establish_connection
 
 from .consts import (
+    EXTRA_ATTRS,
     INITIAL_ATTRS,
     IS_LINUX,
     MIN_MAX_TEMPS,
     MUG_NAME_REGEX,
-    PUSH_EVENT_BATTERY_IDS,
+    PUSH_EVENT_QUEUED_ATTR_TABLE,
+    UPDATE_ATTRS,
     LiquidState,
     MugCharacteristic,
     PushEvent,
     TemperatureUnit,
+    UpdateAttribute,
     VolumeLevel,
 )
 from .data import BatteryInfo, Change, Colour, ModelInfo, MugData, MugFirmwareInfo, MugMeta
@@ -39,8 +44,9 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 
+    from bleak import AdvertisementData
     from bleak.backends.characteristic import BleakGATTCharacteristic
     from bleak.backends.device import BLEDevice
 
@@ -53,6 +59,33 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=16)
+def _pack_temp(temp_centi: int) -> bytes:
+    """Pack a centidegree temperature, cached since the same target repeats across polls."""
+    return struct.pack("<H", temp_centi)
+
+
+# Precompiled so the polling path skips format-string parsing
+_UNPACK_TIMESTAMP = struct.Struct(">I").unpack
+
+# Getter method name per updatable attribute, built once so updates skip per-call f-strings
+_GETTER_NAMES: dict[str, str] = {
+    attr: f"get_{attr}" for attr in EXTRA_ATTRS | INITIAL_ATTRS | UPDATE_ATTRS | {"volume_level"}
+}
+
+# One lock per adapter and event loop, so multiple devices don't race connect attempts
+# on the same radio; asyncio.Lock binds to a loop, so locks must not outlive theirs
+_ADAPTER_LOCKS: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Lock]] = WeakKeyDictionary()
+
+
+def _adapter_lock(adapter: str) -> asyncio.Lock:
+    """Get the connect lock for an adapter on the running event loop."""
+    locks = _ADAPTER_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    if (lock := locks.get(adapter)) is None:
+        lock = locks[adapter] = asyncio.Lock()
+    return lock
+
+
 def require_attribute(
     attr_name: str,
 ) -> Callable[[Callable[Concatenate[EmberMug, P], Awaitable[T]]], Callable[Concatenate[EmberMug, P], Awaitable[T]]]:
@@ -85,6 +118,7 @@ class EmberMug:
         model_info: ModelInfo,
         use_metric: bool = True,
         debug: bool = False,
+        keep_alive: float = 30.0,
         **kwargs: Any,
     ) -> None:
         """Initialize connection manager."""
@@ -92,13 +126,17 @@ class EmberMug:
         self.data = MugData(model_info, use_metric=use_metric, debug=debug)
 
         self.debug = debug
+        self.keep_alive = keep_alive
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self._idle_task: asyncio.Task | None = None
         self._connect_lock = asyncio.Lock()
         self._operation_lock = asyncio.Lock()
         self._expected_disconnect = False
         self._callbacks: dict[Callable[[MugData], None], Callable[[], None]] = {}
+        self._callback_list: tuple[Callable[[MugData], None], ...] = ()
         self._client: BleakClient = None  # type: ignore[assignment]
-        self._queued_updates: set[str] = set()
-        self._latest_events: dict[int, float] = {}
+        self._queued_updates = UpdateAttribute(0)
+        self._latest_events = [0.0] * 256
         self._client_kwargs: dict[str, str] = {}
 
         logger.debug("New mug connection initialized.")
@@ -146,15 +184,19 @@ class EmberMug:
             # Also check after lock is acquired
             if self._client is not None and self._client.is_connected:
                 return
+            adapter_lock = _adapter_lock(self._client_kwargs.get("adapter", "default"))
             try:
                 logger.debug("Establishing a new connection from mug (ID: %s) to %s", id(self), self.device)
-                client = await establish_connection(
-                    client_class=BleakClient,
-                    device=self.device,
-                    name=f"{self.data.name} ({self.device.address})",
-                    disconnected_callback=self._disconnect_callback,
-                    ble_device_callback=lambda: self.device,
-                )
+                async with adapter_lock:
+                    client = await establish_connection(
+                        client_class=BleakClient,
+                        device=self.device,
+                        name=f"{self.data.name} ({self.device.address})",
+                        disconnected_callback=self._disconnect_callback,
+                        ble_device_callback=lambda: self.device,
+                        # Skip service discovery on reconnects, which dominates connection latency on BlueZ
+                        use_services_cache=True,
+                    )
                 if self.debug is True:
                     await discover_services(client)
                 self._expected_disconnect = False
@@ -180,24 +222,45 @@ class EmberMug:
         self._check_operation_lock()
         async with self._operation_lock:
             data = await self._client.read_gatt_char(characteristic.uuid)
-            logger.debug("Read attribute '%s' with value '%s'", characteristic, data)
+            # Skip building log args entirely on this hot path unless debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Read attribute '%s' with value '%s'", characteristic, data)
             return data
 
-    async def _write(self, characteristic: MugCharacteristic, data: bytearray) -> None:
+    async def _write(self, characteristic: MugCharacteristic, data: bytes | bytearray | memoryview) -> None:
         """Help write characteristic to Mug."""
         self._check_operation_lock()
         async with self._operation_lock:
             await self._ensure_connection()
             try:
                 await self._client.write_gatt_char(characteristic.uuid, data)
-                logger.debug("Wrote '%s' to attribute '%s'", data, characteristic)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Wrote '%s' to attribute '%s'", data, characteristic)
             except BleakError as e:
                 logger.error("Failed to write '%s' to attribute '%s': %s", data, characteristic, e)
                 raise
 
+    def _cancel_idle_timer(self) -> None:
+        """Cancel a pending keep-alive disconnect, if any."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def _start_idle_disconnect(self) -> None:
+        """Disconnect after the keep-alive window, holding the task so it is not collected."""
+        self._idle_task = asyncio.get_running_loop().create_task(self.disconnect())
+        self._idle_task.add_done_callback(self._idle_disconnect_done)
+
+    def _idle_disconnect_done(self, task: asyncio.Task) -> None:
+        """Log any error from the deferred disconnect instead of leaving it unobserved."""
+        self._idle_task = None
+        if not task.cancelled() and (error := task.exception()):
+            logger.warning("Error disconnecting after keep-alive window: %s", error)
+
     async def disconnect(self, expected: bool = True) -> None:
         """Disconnect from mug and stop listening to notifications."""
         logger.debug("%s disconnect called", "Expected" if expected else "Unexpected")
+        self._cancel_idle_timer()
         self._expected_disconnect = expected
         if self._client and self._client.is_connected:
             async with self._connect_lock:
@@ -208,6 +271,7 @@ class EmberMug:
 
     def _disconnect_callback(self, client: BleakClient) -> None:
         """Disconnect from device."""
+        self._cancel_idle_timer()
         if self._expected_disconnect:
             logger.debug("Disconnect callback called")
         else:
@@ -216,8 +280,10 @@ class EmberMug:
     def _fire_callbacks(self) -> None:
         """Fire the callbacks."""
         logger.debug("Firing callbacks: %s", self._callbacks)
-        for callback in self._callbacks:
-            callback(self.data)
+        # Iterate the flat tuple, which is cheaper than dict iteration per notification
+        data = self.data
+        for callback in self._callback_list:
+            callback(data)
 
     def _check_operation_lock(self) -> None:
         """Check and print message if lock occupied."""
@@ -233,9 +299,11 @@ class EmberMug:
         def unregister_callback() -> None:
             if callback in self._callbacks:
                 del self._callbacks[callback]
+                self._callback_list = tuple(self._callbacks)
             logger.debug("Unregistered callback: %s", callback)
 
         self._callbacks[callback] = unregister_callback
+        self._callback_list = tuple(self._callbacks)
         logger.debug("Registered callback: %s", callback)
         return unregister_callback
 
@@ -267,7 +335,8 @@ class EmberMug:
     @require_attribute("led_colour")
     async def set_led_colour(self, colour: Colour) -> None:
         """Set new target temp for mug."""
-        await self._write(MugCharacteristic.LED, colour.as_bytearray())
+        # Immutable payload: a shared buffer could be overwritten by a concurrent call
+        await self._write(MugCharacteristic.LED, bytes(colour))
         self.data.led_colour = colour
 
     async def get_target_temp(self) -> float:
@@ -285,8 +354,7 @@ class EmberMug:
         if self.data.use_metric is False:
             target_temp = convert_temp_to_celsius(target_temp)
 
-        target = bytearray(int(target_temp / 0.01).to_bytes(2, "little"))
-        await self._write(MugCharacteristic.TARGET_TEMPERATURE, target)
+        await self._write(MugCharacteristic.TARGET_TEMPERATURE, _pack_temp(int(target_temp / 0.01)))
         self.data.target_temp = target_temp
 
     async def get_current_temp(self) -> float:
@@ -331,10 +399,11 @@ class EmberMug:
     @require_attribute("name")
     async def set_name(self, name: str) -> None:
         """Assign new name to mug."""
-        if MUG_NAME_REGEX.match(name) is None:
+        # isascii() is a single C-level check, so it cheaply rejects most invalid names before the regex
+        if not name.isascii() or MUG_NAME_REGEX.match(name) is None:
             msg = "Name cannot contain any special characters and must be 16 characters or less"
             raise ValueError(msg)
-        await self._write(MugCharacteristic.MUG_NAME, bytearray(name.encode("utf8")))
+        await self._write(MugCharacteristic.MUG_NAME, bytearray(name.encode("ascii")))
         self.data.name = name
 
     async def get_udsk(self) -> str | None:
@@ -377,8 +446,9 @@ class EmberMug:
 
     async def ensure_correct_unit(self) -> None:
         """Set mug unit if it's not what we want."""
-        desired = TemperatureUnit.CELSIUS if self.data.use_metric else TemperatureUnit.FAHRENHEIT
-        if self.data.temperature_unit != desired:
+        data = self.data
+        desired = TemperatureUnit.CELSIUS if data.use_metric else TemperatureUnit.FAHRENHEIT
+        if data.temperature_unit != desired:
             await self.set_temperature_unit(desired)
 
     async def get_battery_voltage(self) -> int:
@@ -389,42 +459,47 @@ class EmberMug:
     async def get_date_time_zone(self) -> datetime | None:
         """Get date and time zone."""
         date_time_zone_bytes = await self._read(MugCharacteristic.DATE_TIME_AND_ZONE)
-        time_value = bytes_to_big_int(date_time_zone_bytes[:4])
+        (time_value,) = _UNPACK_TIMESTAMP(bytes(date_time_zone_bytes[:4]))
         return datetime.fromtimestamp(time_value, UTC) if time_value > 0 else None
 
     async def get_firmware(self) -> MugFirmwareInfo:
         """Get firmware info."""
         return MugFirmwareInfo.from_bytes(await self._read(MugCharacteristic.FIRMWARE))
 
-    async def update_initial(self) -> list[Change]:
+    async def update_initial(self) -> Sequence[Change]:
         """Update attributes that don't normally change and don't need to be regularly updated."""
         return await self._update_multiple(INITIAL_ATTRS)
 
-    async def update_all(self) -> list[Change]:
+    async def update_all(self) -> Sequence[Change]:
         """Update all standard attributes."""
         return await self._update_multiple(
             self.data.model_info.device_attributes - INITIAL_ATTRS,
         )
 
-    async def _update_multiple(self, attrs: set[str]) -> list[Change]:
+    async def _update_multiple(self, attrs: set[str] | frozenset[str]) -> Sequence[Change]:
         """Update a list of attributes from the mug."""
         logger.debug("Updating the following attributes: %s", attrs)
         await self._ensure_connection()
-        changes = self.data.update_info(**{attr: await getattr(self, f"get_{attr}")() for attr in attrs})
+        # Submit all reads at once instead of awaiting them one by one
+        attr_list = list(attrs)
+        results = await asyncio.gather(*(getattr(self, _GETTER_NAMES[attr])() for attr in attr_list))
+        changes = self.data.update_info(**dict(zip(attr_list, results, strict=True)))
         if changes:
             self._fire_callbacks()
         logger.debug("Attributes updated: %s", changes)
         return changes
 
-    async def update_queued_attributes(self) -> list[Change]:
+    async def update_queued_attributes(self) -> Sequence[Change]:
         """Update all attributes in queue."""
         logger.debug("Updating queued attributes: %s", self._queued_updates)
         if not self._queued_updates:
-            return []
-        queued_updates = set(self._queued_updates)
-        self._queued_updates.clear()
+            return ()
+        queued_updates = [flag.attr for flag in UpdateAttribute if flag & self._queued_updates]
+        self._queued_updates = UpdateAttribute(0)
         await self._ensure_connection()
-        changes = self.data.update_info(**{attr: await getattr(self, f"get_{attr}")() for attr in queued_updates})
+        # Submit all reads at once instead of awaiting them one by one
+        results = await asyncio.gather(*(getattr(self, _GETTER_NAMES[attr])() for attr in queued_updates))
+        changes = self.data.update_info(**dict(zip(queued_updates, results, strict=True)))
         if changes:
             self._fire_callbacks()
         return changes
@@ -433,7 +508,7 @@ class EmberMug:
         """Push events from the mug to indicate changes."""
         event_id = data[0]
         now = time()
-        if (last_time := self._latest_events.get(event_id)) and now - last_time < 5:
+        if (last_time := self._latest_events[event_id]) and now - last_time < 5:
             return
         self._latest_events[event_id] = now
 
@@ -441,34 +516,25 @@ class EmberMug:
             logger.info("Statistics received from %s (%s) - Data: %s.", self.model_name, event_id, data)
             return
 
-        logger.debug("Push event received from %s (%s) - Data: %s.", self.model_name, event_id, data)
-
-        # Check known IDs
-        if event_id in PUSH_EVENT_BATTERY_IDS:
-            # 1, 2 and 3 : Battery Change
-            if event_id in (
-                PushEvent.CHARGER_CONNECTED,
-                PushEvent.CHARGER_DISCONNECTED,
-            ):
-                self.data.battery = BatteryInfo(
-                    percent=self.data.battery.percent if self.data.battery else 0,
-                    on_charging_base=event_id == PushEvent.CHARGER_CONNECTED,
-                )
-                self._fire_callbacks()
-            # All indicate changes in battery
-            self._queued_updates.add("battery")
-        elif event_id == PushEvent.TARGET_TEMPERATURE_CHANGED:
-            self._queued_updates.add("target_temp")
-        elif event_id == PushEvent.DRINK_TEMPERATURE_CHANGED:
-            self._queued_updates.add("current_temp")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Push event received from %s (%s) - Data: %s.", self.model_name, event_id, data)
+
+        # 2 and 3 indicate a charger change that can be applied immediately
+        if event_id in (
+            PushEvent.CHARGER_CONNECTED,
+            PushEvent.CHARGER_DISCONNECTED,
+        ):
+            self.data.battery = BatteryInfo(
+                percent=self.data.battery.percent if self.data.battery else 0,
+                on_charging_base=event_id == PushEvent.CHARGER_CONNECTED,
+            )
+            self._fire_callbacks()
+
+        # Check known IDs via lookup table instead of an if/elif chain
+        if queued_attr := PUSH_EVENT_QUEUED_ATTR_TABLE[event_id]:
+            self._queued_updates |= queued_attr
         elif event_id == PushEvent.AUTH_INFO_NOT_FOUND:
             logger.warning("Auth info missing")
-        elif event_id == PushEvent.LIQUID_LEVEL_CHANGED:
-            self._queued_updates.add("liquid_level")
-        elif event_id == PushEvent.LIQUID_STATE_CHANGED:
-            self._queued_updates.add("liquid_state")
-        elif event_id == PushEvent.BATTERY_VOLTAGE_STATE_CHANGED:
-            self._queued_updates.add("battery_voltage")
         else:
             logger.debug("Unknown event received %s", event_id)
 
@@ -501,9 +567,21 @@ class EmberMug:
 
     @contextlib.asynccontextmanager
     async def connection(self, **kwargs: str) -> AsyncIterator[EmberMug]:
-        """Establish a connection and close automatically."""
+        """
+        Establish a connection and close automatically.
+
+        The connection is kept alive for `keep_alive` seconds after exit,
+        so re-entering within that window skips connection setup entirely.
+        """
         self.set_client_options(**kwargs)
+        self._cancel_idle_timer()
         # This will happen automatically, but calling it now will give us immediate feedback
         await self._ensure_connection()
         yield self
-        await self.disconnect()
+        if self.keep_alive > 0:
+            self._idle_handle = asyncio.get_running_loop().call_later(
+                self.keep_alive,
+                self._start_idle_disconnect,
+            )
+        else:
+            await self.disconnect()
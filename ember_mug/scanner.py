@@ -18,6 +18,9 @@ if TYPE_CHECKING:
 
 DEFAULT_TIMEOUT = 30
 
+# Shared base for every scan start; DEVICE_SERVICE_UUIDS is an immutable tuple, so aliasing is safe
+_BASE_SCANNER_KWARGS: dict[str, Any] = {"service_uuids": DEVICE_SERVICE_UUIDS}
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,8 +29,7 @@ def build_scanner_kwargs(adapter: str | None = None) -> dict[str, Any]:
     if adapter and IS_LINUX is not True:
         msg = "The adapter option is only valid for the Linux BlueZ Backend."
         raise ValueError(msg)
-    kwargs = {"service_uuids": DEVICE_SERVICE_UUIDS}
-    return kwargs | {"adapter": adapter} if adapter else kwargs
+    return _BASE_SCANNER_KWARGS | {"adapter": adapter} if adapter else dict(_BASE_SCANNER_KWARGS)
 
 
 async def discover_devices(
@@ -47,13 +49,25 @@ async def discover_devices(
         ```
 
     """
+    if mac is not None:
+        mac = mac.lower()
     async with BleakScanner(**build_scanner_kwargs(adapter)) as scanner:
-        await asyncio.sleep(wait)
-        return [
-            (d, a)
-            for (d, a) in scanner.discovered_devices_and_advertisement_data.values()
-            if mac is None or d.address.lower() == mac.lower()
-        ]
+        if mac is None:
+            await asyncio.sleep(wait)
+        else:
+            # Stop waiting as soon as the requested device shows up
+            for _ in range(wait):
+                devices_and_data = scanner.discovered_devices_and_advertisement_data
+                if mac in devices_and_data or mac.upper() in devices_and_data:
+                    break
+                await asyncio.sleep(1)
+        devices_and_data = scanner.discovered_devices_and_advertisement_data
+        if mac is None:
+            return list(devices_and_data.values())
+        # The scanner keys this dict by address, so try a direct hit before scanning all entries
+        if found := (devices_and_data.get(mac) or devices_and_data.get(mac.upper())):
+            return [found]
+        return [(d, a) for (d, a) in devices_and_data.values() if d.address.lower() == mac]
 
 
 async def find_device(
@@ -77,8 +91,9 @@ async def find_device(
         with contextlib.suppress(asyncio.TimeoutError):
             async with asyncio.timeout(timeout):
                 async for device, advertisement in scanner.advertisement_data():
-                    if (not mac and device.name and device.name.startswith("Ember")) or (
-                        mac and device.address.lower() == mac
-                    ):
+                    if mac is None:
+                        if device.name and device.name.startswith("Ember"):
+                            return device, advertisement
+                    elif device.address.lower() == mac:
                         return device, advertisement
     return None, None
@@ -2,48 +2,59 @@
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import binascii
 import contextlib
 import logging
-import re
+import struct
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
-from bleak import AdvertisementData, BleakError
+from bleak import BleakError
 
 from ember_mug.consts import EMBER_BLE_SIG, TRAVEL_MUG_SERVICE_UUIDS, DeviceColour, DeviceModel
 
 if TYPE_CHECKING:
-    from bleak import BleakClient
+    from bleak import AdvertisementData, BleakClient
 
     from ember_mug.data import ModelInfo
 
 logger = logging.getLogger(__name__)
 
+# Temperatures arrive as little-endian uint16 hundredths of a degree
+_UNPACK_TEMP = struct.Struct("<H").unpack_from
+
+
+@lru_cache(maxsize=8)
+def _decode_cached(data: bytes) -> str:
+    """Encode bytes as base64 text, memoized since the DSK/UDSK rarely change between polls."""
+    with contextlib.suppress(ValueError):
+        return binascii.b2a_base64(data, newline=False).decode()
+    logger.warning('Failed to decode bytes "%s". Forcing to string.', data)
+    return str(data)
+
 
 def decode_byte_string(data: bytes | bytearray) -> str:
     """Convert bytes to text as Ember expects."""
     if not data:
         return ""
-    with contextlib.suppress(ValueError):
-        b64_as_str = base64.encodebytes(data).decode()
-        return re.sub("[\r\n]", "", b64_as_str)
-    logger.warning('Failed to decode bytes "%s". Forcing to string.', data)
-    return str(data)
+    return _decode_cached(bytes(data))
 
 
+@lru_cache(maxsize=8)
 def encode_byte_string(data: str) -> bytes:
     """Encode string from Ember Mug."""
-    return re.sub(b"[\r\n]", b"", base64.encodebytes(data.encode()))
+    return binascii.b2a_base64(data.encode(), newline=False)
 
 
 def bytes_to_little_int(data: bytearray | bytes) -> int:
     """Convert bytes to little int."""
-    return int.from_bytes(data, byteorder="little", signed=False)
+    return int.from_bytes(data, "little")
 
 
 def bytes_to_big_int(data: bytearray | bytes, signed: bool = False) -> int:
     """Convert bytes to big int."""
-    return int.from_bytes(data, byteorder="big", signed=signed)
+    return int.from_bytes(data, "big", signed=signed)
 
 
 def convert_temp_to_fahrenheit(temp: float) -> float:
@@ -58,12 +69,13 @@ def convert_temp_to_celsius(temp: float) -> float:
 
 def temp_from_bytes(temp_bytes: bytearray, metric: bool = True) -> float:
     """Get temperature from bytearray and convert to Fahrenheit if needed."""
-    temp = float(bytes_to_little_int(temp_bytes)) * 0.01
+    temp = _UNPACK_TEMP(temp_bytes)[0] * 0.01
     if metric is False:
-        temp = convert_temp_to_fahrenheit(temp)
+        temp = temp * 1.8 + 32
     return round(temp, 2)
 
 
+@lru_cache(maxsize=64)
 def get_colour_from_int(colour_id: int) -> DeviceColour | None:
     """Extrapolate device colour from integer in advertiser data."""
     if colour_id in (-127, -63, 1, 14, 65):
@@ -86,11 +98,20 @@ def get_colour_from_int(colour_id: int) -> DeviceColour | None:
     }.get(colour_id)
 
 
-def get_model_from_single_int_and_services(  # noqa PLR0911
+def get_model_from_single_int_and_services(
     model_id: int,
     service_uuids: list[str],
 ) -> DeviceModel | None:
     """Extrapolate device model from integer in advertiser data."""
+    return _get_model_from_single_int_and_services(model_id, tuple(service_uuids))
+
+
+@lru_cache(maxsize=64)
+def _get_model_from_single_int_and_services(  # noqa PLR0911
+    model_id: int,
+    service_uuids: tuple[str, ...],
+) -> DeviceModel | None:
+    """Classify the model, memoized on hashable arguments."""
     if set(TRAVEL_MUG_SERVICE_UUIDS).intersection(service_uuids):
         return DeviceModel.TRAVEL_MUG_12_OZ
     if model_id in (1, 2, 3):
@@ -106,21 +127,26 @@ def get_model_from_single_int_and_services(  # noqa PLR0911
     return None
 
 
+# Models 1 and 2 depend on the generation; the rest map straight from the identifier
+_GEN_1_MODELS = {1: DeviceModel.MUG_1_10_OZ, 2: DeviceModel.MUG_1_14_OZ}
+_GEN_2_MODELS = {1: DeviceModel.MUG_2_10_OZ, 2: DeviceModel.MUG_2_14_OZ}
+_FIXED_MODELS = {
+    3: DeviceModel.TRAVEL_MUG_12_OZ,
+    8: DeviceModel.CUP_6_OZ,
+    9: DeviceModel.TUMBLER_16_OZ,
+}
+
+
+@lru_cache(maxsize=64)
 def get_model_from_id_and_gen(model_id: int, generation: int) -> DeviceModel | None:
     """Extract model from identifier in advertiser data."""
-    if model_id == 1:
-        return DeviceModel.MUG_1_10_OZ if generation < 2 else DeviceModel.MUG_2_10_OZ
-    if model_id == 2:
-        return DeviceModel.MUG_1_14_OZ if generation < 2 else DeviceModel.MUG_2_14_OZ
-    if model_id == 3:
-        return DeviceModel.TRAVEL_MUG_12_OZ
-    if model_id == 8:
-        return DeviceModel.CUP_6_OZ
-    if model_id == 9:
-        return DeviceModel.TUMBLER_16_OZ
-    return None
+    if model := _FIXED_MODELS.get(model_id):
+        return model
+    models = _GEN_1_MODELS if generation < 2 else _GEN_2_MODELS
+    return models.get(model_id)
 
 
+@lru_cache(maxsize=64)
 def guess_model_from_name(name: str | None) -> DeviceModel | None:
     """Guess model from BLE name."""
     if not name:
@@ -138,29 +164,60 @@ def get_model_info_from_advertiser_data(advertisement: AdvertisementData) -> Mod
 
     model_data = advertisement.manufacturer_data.get(EMBER_BLE_SIG, None)
     if model_data is not None:
-        if len(model_data) < 4:
-            model_id = bytes_to_big_int(model_data, signed=True)
-            return ModelInfo(
-                get_model_from_single_int_and_services(model_id, advertisement.service_uuids),
-                get_colour_from_int(model_id),
-            )
-        model_id, generation, colour_id = model_data[1:4]
-        return ModelInfo(
-            get_model_from_id_and_gen(model_id, generation),
-            get_colour_from_int(colour_id),
+        model, colour = _model_and_colour_from_manufacturer_data(
+            bytes(model_data),
+            tuple(advertisement.service_uuids),
         )
+        return ModelInfo(model, colour)
     logger.debug(
         "Unable to reliably determine model info from advertiser data." "Falling back to guessing based on name.",
     )
     return ModelInfo(guess_model_from_name(advertisement.local_name))
 
 
+@lru_cache(maxsize=64)
+def _model_and_colour_from_manufacturer_data(
+    model_data: bytes,
+    service_uuids: tuple[str, ...],
+) -> tuple[DeviceModel | None, DeviceColour | None]:
+    """Parse manufacturer data once per distinct payload; devices repeat it every advertisement."""
+    if len(model_data) < 4:
+        model_id = bytes_to_big_int(model_data, signed=True)
+        return _get_model_from_single_int_and_services(model_id, service_uuids), get_colour_from_int(model_id)
+    model_id, generation, colour_id = model_data[1:4]
+    return get_model_from_id_and_gen(model_id, generation), get_colour_from_int(colour_id)
+
+
 async def discover_services(client: BleakClient) -> dict[str, Any]:
     """Log all services and all values for debugging/development."""
+    debug_enabled = bool(logger.isEnabledFor(logging.DEBUG))
     logger.info("Logging all services that were discovered")
     services: dict[str, Any] = {}
+    # Issue all reads at once so the BLE round-trips overlap instead of serializing
+    read_characteristics = [
+        characteristic
+        for service in client.services
+        for characteristic in service.characteristics
+        if "read" in characteristic.properties
+    ]
+    all_descriptors = [
+        descriptor
+        for service in client.services
+        for characteristic in service.characteristics
+        for descriptor in characteristic.descriptors
+    ]
+    characteristic_values = iter(
+        await asyncio.gather(
+            *(client.read_gatt_char(characteristic.uuid) for characteristic in read_characteristics),
+            return_exceptions=True,
+        ),
+    )
+    descriptor_values = iter(
+        await asyncio.gather(*(client.read_gatt_descriptor(descriptor.handle) for descriptor in all_descriptors)),
+    )
     for service in client.services:
-        logger.debug("[Service] %s: %s", service.uuid, service.description)
+        if debug_enabled:
+            logger.debug("[Service] %s: %s", service.uuid, service.description)
         characteristics: dict[str, Any] = {}
         services[service.uuid] = {
             "uuid": service.uuid,
@@ -169,17 +226,18 @@ async def discover_services(client: BleakClient) -> dict[str, Any]:
         for characteristic in service.characteristics:
             value: bytes | BleakError | None = None
             if "read" in characteristic.properties:
-                try:
-                    value = bytes(await client.read_gatt_char(characteristic.uuid))
-                except BleakError as e:
-                    value = e
-            logger.debug(
-                "\t[Characteristic] %s: %s | Description: %s | Value: '%s'",
-                characteristic.uuid,
-                ",".join(characteristic.properties),
-                characteristic.description,
-                value,
-            )
+                result = next(characteristic_values)
+                if isinstance(result, BaseException) and not isinstance(result, BleakError):
+                    raise result
+                value = result if isinstance(result, BleakError) else bytes(result)
+            if debug_enabled:
+                logger.debug(
+                    "\t[Characteristic] %s: %s | Description: %s | Value: '%s'",
+                    characteristic.uuid,
+                    ",".join(characteristic.properties),
+                    characteristic.description,
+                    value,
+                )
             descriptors: list[dict[str, Any]] = []
             characteristics[characteristic.uuid] = {
                 "uuid": characteristic.uuid,
@@ -188,13 +246,14 @@ async def discover_services(client: BleakClient) -> dict[str, Any]:
                 "descriptors": descriptors,
             }
             for descriptor in characteristic.descriptors:
-                value = bytes(await client.read_gatt_descriptor(descriptor.handle))
-                logger.debug(
-                    "\t\t[Descriptor] %s: Handle: %s | Value: '%s'",
-                    descriptor.uuid,
-                    descriptor.handle,
-                    value,
-                )
+                value = bytes(next(descriptor_values))
+                if debug_enabled:
+                    logger.debug(
+                        "\t\t[Descriptor] %s: Handle: %s | Value: '%s'",
+                        descriptor.uuid,
+                        descriptor.handle,
+                        value,
+                    )
                 descriptors.append(
                     {
                         "uuid": descriptor.uuid,
@@ -0,0 +1,122 @@
+"""Shared test utils and fixtures, defined once for all conftest modules."""
+
+from __future__ import annotations
+
+import asyncio
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
+
+import pytest
+from bleak import AdvertisementData
+from bleak.backends.device import BLEDevice
+
+from ember_mug import EmberMug
+from ember_mug.consts import EMBER_BLE_SIG, DeviceColour, DeviceModel, MugCharacteristic
+from ember_mug.data import ModelInfo, MugData
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+TEST_MAC = "32:36:a5:be:88:cb"
+TEST_MUG_BLUETOOTH_NAME = "Ember Ceramic Mug"
+
+
+class AsyncContextManager:
+    """Stub for mocking."""
+
+    async def __aenter__(self) -> AsyncContextManager:
+        """Return self."""
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException], exc: BaseException, tb: FrameType) -> None:
+        """Close and do nothing."""
+        pass
+
+
+# A plain stub instance is much cheaper than a spec'd MagicMock
+mock_connection = AsyncContextManager()
+
+
+def async_mock(return_value: Any = None) -> Mock:
+    """Build an awaitable Mock, which is much cheaper to construct than AsyncMock."""
+
+    def completed_future(*args: Any, **kwargs: Any) -> asyncio.Future:
+        future: asyncio.Future = asyncio.Future()
+        future.set_result(return_value)
+        return future
+
+    return Mock(side_effect=completed_future)
+
+
+# Raw manufacturer data payloads, usable without Enum descriptor lookups
+MANUFACTURER_DATA_MUG_2_BLACK = b"\x81"
+MANUFACTURER_DATA_TUMBLER = b"\x01\t\x03\x0e"
+MANUFACTURER_DATA_RED_TRAVEL_MUG = b"\x0b"
+
+
+class TestManufacturerData(bytes, Enum):
+    """Test values for manufacturer data."""
+
+    UNKNOWN = b""
+    MUG_2_BLACK = MANUFACTURER_DATA_MUG_2_BLACK
+    TUMBLER = MANUFACTURER_DATA_TUMBLER
+    RED_TRAVEL_MUG = MANUFACTURER_DATA_RED_TRAVEL_MUG
+
+
+def build_advertisement_data(
+    manufacturer_data: bytes | None = None,
+    service_uuids: list[MugCharacteristic] | None = None,
+    name: str = TEST_MUG_BLUETOOTH_NAME,
+) -> AdvertisementData:
+    if service_uuids is None:
+        service_uuids = [MugCharacteristic.STANDARD_SERVICE]
+
+    data_dict: dict[int, bytes] = {}
+    if manufacturer_data is not None:
+        data_dict[EMBER_BLE_SIG] = manufacturer_data
+
+    return AdvertisementData(
+        local_name=name,
+        manufacturer_data=data_dict,
+        service_data={},
+        service_uuids=[str(service) for service in service_uuids],
+        tx_power=1,
+        rssi=1,
+        platform_data=(),
+    )
+
+
+TEST_UNKNOWN_ADVERTISEMENT = build_advertisement_data(None)
+TEST_MUG_ADVERTISEMENT = build_advertisement_data(MANUFACTURER_DATA_MUG_2_BLACK)
+TEST_TUMBLER_ADVERTISEMENT = build_advertisement_data(MANUFACTURER_DATA_TUMBLER)
+TEST_TRAVEL_MUG_ADVERTISEMENT = build_advertisement_data(
+    MANUFACTURER_DATA_RED_TRAVEL_MUG,
+    [MugCharacteristic.TRAVEL_MUG_SERVICE],
+)
+
+
+@pytest.fixture(name="ble_device", scope="module")
+def ble_device_fixture() -> BLEDevice:
+    return BLEDevice(address=TEST_MAC, name=TEST_MUG_BLUETOOTH_NAME, details={}, rssi=1)
+
+
+# Tests only ever replace model_info wholesale, so one instance can be shared
+DEFAULT_MODEL_INFO = ModelInfo()
+
+
+@pytest.fixture
+def mug_data() -> MugData:
+    return MugData(DEFAULT_MODEL_INFO)
+
+
+# Module-scoped to avoid rebuilding the mug for every test.
+# Modules that mutate it (e.g. test_connection) reset state per test.
+@pytest.fixture(scope="module")
+def ember_mug(ble_device: BLEDevice) -> EmberMug:
+    mug = EmberMug(
+        ble_device,
+        ModelInfo(DeviceModel.MUG_2_10_OZ, DeviceColour.BLACK),
+    )
+    mug._client = Mock()
+    return mug
@@ -72,6 +72,7 @@ async def test_get_device(
         ModelInfo(DeviceModel.MUG_2_10_OZ, DeviceColour.BLACK),
         use_metric=True,
         debug=False,
+        keep_alive=0,
     )
     captured = capsys.readouterr()
     assert captured.out == "Connecting...\n"
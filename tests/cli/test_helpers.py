@@ -17,6 +17,42 @@ if TYPE_CHECKING:
 
     from ember_mug import EmberMug
 
+# Expected output hoisted to module level so dedent only runs at import time
+EXPECTED_PRINT_CHANGES = dedent(
+    """\
+    Name changed from "Mug Name" to "Test Mug"
+    Liquid Level changed from "3.33%" to "6.67%"
+    Liquid State changed from "Empty" to "Heating"
+    Target Temp changed from "45.00°C" to "55.00°C"
+    """,
+)
+EXPECTED_PRINT_INFO = dedent(
+    """\
+    Device Data
+    +--------------+---------+
+    | Device Name  |         |
+    +--------------+---------+
+    | Meta         | None    |
+    +--------------+---------+
+    | Battery      | None    |
+    +--------------+---------+
+    | Firmware     | None    |
+    +--------------+---------+
+    | LED Colour   | #ffffff |
+    +--------------+---------+
+    | Liquid State | Unknown |
+    +--------------+---------+
+    | Liquid Level | 0.00%   |
+    +--------------+---------+
+    | Current Temp | 0.00°C  |
+    +--------------+---------+
+    | Target Temp  | 0.00°C  |
+    +--------------+---------+
+    | Use Metric   | True    |
+    +--------------+---------+
+    """,
+)
+
 
 def test_validate_mac() -> None:
     with pytest.raises(ArgumentTypeError, match="Invalid MAC Address"):
@@ -44,14 +80,7 @@ def test_print_changes(capsys: CaptureFixture) -> None:
     ]
     print_changes(changes, True)
     captured = capsys.readouterr()
-    assert captured.out == dedent(
-        """\
-        Name changed from "Mug Name" to "Test Mug"
-        Liquid Level changed from "3.33%" to "6.67%"
-        Liquid State changed from "Empty" to "Heating"
-        Target Temp changed from "45.00°C" to "55.00°C"
-        """,
-    )
+    assert captured.out == EXPECTED_PRINT_CHANGES
 
 
 def test_print_table(ember_mug: EmberMug, capsys: CaptureFixture) -> None:
@@ -64,29 +93,4 @@ def test_print_info(ember_mug: EmberMug, capsys: CaptureFixture) -> None:
     ember_mug.debug = False
     print_info(ember_mug)
     captured = capsys.readouterr()
-    assert captured.out == dedent(
-        """\
-        Device Data
-        +--------------+---------+
-        | Device Name  |         |
-        +--------------+---------+
-        | Meta         | None    |
-        +--------------+---------+
-        | Battery      | None    |
-        +--------------+---------+
-        | Firmware     | None    |
-        +--------------+---------+
-        | LED Colour   | #ffffff |
-        +--------------+---------+
-        | Liquid State | Unknown |
-        +--------------+---------+
-        | Liquid Level | 0.00%   |
-        +--------------+---------+
-        | Current Temp | 0.00°C  |
-        +--------------+---------+
-        | Target Temp  | 0.00°C  |
-        +--------------+---------+
-        | Use Metric   | True    |
-        +--------------+---------+
-        """,
-    )
+    assert captured.out == EXPECTED_PRINT_INFO
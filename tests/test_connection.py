@@ -2,27 +2,34 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import DEFAULT, AsyncMock, Mock, patch
 
 import pytest
 from bleak import BleakError
 from bleak.backends.device import BLEDevice
 
+from ember_mug import mug as mug_module
 from ember_mug.consts import (
     INITIAL_ATTRS,
     UPDATE_ATTRS,
+    DeviceColour,
     DeviceModel,
+    LiquidState,
     MugCharacteristic,
     TemperatureUnit,
+    UpdateAttribute,
     VolumeLevel,
 )
-from ember_mug.data import Colour, ModelInfo
+from ember_mug.data import BatteryInfo, Colour, ModelInfo, MugData, MugFirmwareInfo, MugMeta
 from ember_mug.mug import EmberMug
-from tests.conftest import TEST_MUG_ADVERTISEMENT
+from tests.conftest import TEST_MUG_ADVERTISEMENT, async_mock
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
 
     class MockMug(EmberMug):
         """For type checking."""
@@ -30,25 +37,62 @@ if TYPE_CHECKING:
         _client: AsyncMock
 
 
-@patch("ember_mug.mug.IS_LINUX", True)
-async def test_adapter_with_bluez(ble_device: BLEDevice):
+# Patch the stable module attributes once instead of per-test decorators
+@pytest.fixture(name="mug_mocks", scope="module", autouse=True)
+def mug_mocks_fixture() -> Generator[SimpleNamespace, None, None]:
+    with patch.multiple("ember_mug.mug", logger=DEFAULT, establish_connection=DEFAULT) as mocks:
+        yield SimpleNamespace(**mocks)
+
+
+# One AsyncMock client for the whole module; reset between tests
+@pytest.fixture(name="mock_client", scope="module")
+def mock_client_fixture() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_ember_mug(
+    ember_mug: MockMug,
+    ble_device: BLEDevice,
+    mug_mocks: SimpleNamespace,
+    mock_client: AsyncMock,
+) -> None:
+    """Reset the module-scoped mug so each test starts from a clean state."""
+    ember_mug.device = ble_device
+    ember_mug.data = MugData(ModelInfo(DeviceModel.MUG_2_10_OZ, DeviceColour.BLACK))
+    mock_client.reset_mock(return_value=True, side_effect=True)
+    mock_client.is_connected = True
+    ember_mug._client = mock_client
+    ember_mug._queued_updates = UpdateAttribute(0)
+    ember_mug._latest_events = [0.0] * 256
+    ember_mug._callbacks.clear()
+    ember_mug._callback_list = ()
+    ember_mug._client_kwargs = {}
+    ember_mug.keep_alive = 30.0
+    ember_mug._cancel_idle_timer()
+    ember_mug.__dict__.pop("model_name", None)
+    mug_mocks.logger.reset_mock()
+    mug_mocks.establish_connection.reset_mock(return_value=True, side_effect=True)
+
+
+async def test_adapter_with_bluez(ble_device: BLEDevice, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("ember_mug.mug.IS_LINUX", True)
     mug = EmberMug(ble_device, ModelInfo(), adapter="hci0")
     assert mug._client_kwargs["adapter"] == "hci0"
 
 
-@patch("ember_mug.mug.IS_LINUX", False)
-async def test_adapter_without_bluez(ble_device: BLEDevice):
+async def test_adapter_without_bluez(ble_device: BLEDevice, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("ember_mug.mug.IS_LINUX", False)
     expected_message = "The adapter option is only valid for the Linux BlueZ Backend."
     with pytest.raises(ValueError, match=expected_message):
         EmberMug(ble_device, ModelInfo(), adapter="hci0")
 
 
 @patch("ember_mug.mug.EmberMug.subscribe")
-@patch("ember_mug.mug.establish_connection")
 async def test_connect(
     mug_subscribe: Mock,
-    mock_establish_connection: Mock,
     ember_mug: MockMug,
+    mug_mocks: SimpleNamespace,
 ) -> None:
     # Already connected
     ember_mug._client = AsyncMock()
@@ -56,76 +100,94 @@ async def test_connect(
     async with ember_mug.connection():
         pass
     mug_subscribe.assert_not_called()
-    mock_establish_connection.assert_not_called()
+    mug_mocks.establish_connection.assert_not_called()
 
     # Not connected
-    mock_disconnect = AsyncMock()
+    mock_disconnect = async_mock()
     with patch.multiple(ember_mug, _client=None, disconnect=mock_disconnect):
         async with ember_mug.connection():
             pass
 
-        mock_establish_connection.assert_called()
+        mug_mocks.establish_connection.assert_called()
+        assert mug_mocks.establish_connection.call_args.kwargs["use_services_cache"] is True
         mug_subscribe.assert_called()
         assert ember_mug._client is not None
+        # The disconnect is deferred by the keep-alive timer
+        mock_disconnect.assert_not_called()
+        assert ember_mug._idle_handle is not None
+
+    # Without a keep-alive it disconnects immediately
+    ember_mug.keep_alive = 0
+    with patch.multiple(ember_mug, disconnect=mock_disconnect):
+        async with ember_mug.connection():
+            pass
         mock_disconnect.assert_called()
 
 
-@patch("ember_mug.mug.logger")
-@patch("ember_mug.mug.establish_connection")
-async def test_connect_error(
-    mock_establish_connection: Mock,
-    mock_logger: Mock,
+@patch("ember_mug.mug.EmberMug.subscribe")
+async def test_connection_reuse(
+    mug_subscribe: Mock,
     ember_mug: MockMug,
+    mug_mocks: SimpleNamespace,
+) -> None:
+    ember_mug._client = None  # type: ignore[assignment]
+    mug_mocks.establish_connection.return_value = AsyncMock(is_connected=True)
+    async with ember_mug.connection():
+        pass
+    assert ember_mug._idle_handle is not None
+    # Re-entering within the keep-alive window reuses the connection
+    async with ember_mug.connection():
+        pass
+    mug_mocks.establish_connection.assert_called_once()
+    await ember_mug.disconnect()
+    assert ember_mug._idle_handle is None
+
+
+@patch("ember_mug.mug.EmberMug.subscribe")
+async def test_adapter_lock_serializes_connects(
+    mug_subscribe: Mock,
+    ble_device: BLEDevice,
+    mug_mocks: SimpleNamespace,
 ) -> None:
+    mug_mocks.establish_connection.return_value = AsyncMock(is_connected=True)
+    first_mug = EmberMug(ble_device, ModelInfo())
+    second_mug = EmberMug(ble_device, ModelInfo())
+    # Both mugs use the same radio, so their connect attempts share one adapter lock
+    await asyncio.gather(first_mug._ensure_connection(), second_mug._ensure_connection())
+    assert mug_mocks.establish_connection.call_count == 2
+    assert not mug_module._adapter_lock("default").locked()
+
+
+async def test_connect_error(ember_mug: MockMug, mug_mocks: SimpleNamespace) -> None:
     ember_mug._client = None  # type: ignore[assignment]
-    mock_establish_connection.side_effect = BleakError("bleak-error")
+    mug_mocks.establish_connection.side_effect = BleakError("bleak-error")
     with pytest.raises(BleakError, match="bleak-error"):
         await ember_mug._ensure_connection()
-    device, exception = mock_logger.debug.mock_calls[1].args[1:]
+    device, exception = mug_mocks.logger.debug.mock_calls[1].args[1:]
     assert device == ember_mug.device
     assert isinstance(exception, BleakError)
 
 
-@patch("ember_mug.mug.logger")
-@patch("ember_mug.mug.establish_connection")
-async def test_pairing_exceptions_esphome(
-    mock_establish_connection: Mock,
-    mock_logger: Mock,
-    ember_mug: MockMug,
-) -> None:
+async def test_pairing_exceptions_esphome(ember_mug: MockMug, mug_mocks: SimpleNamespace) -> None:
     ember_mug._client.is_connected = False
     mock_client = AsyncMock()
     mock_client.connect.side_effect = BleakError
     mock_client.pair.side_effect = NotImplementedError
-    mock_establish_connection.return_value = mock_client
-    with patch.multiple(
-        ember_mug,
-        update_initial=AsyncMock(),
-        subscribe=AsyncMock(),
-    ):
-        await ember_mug._ensure_connection()
+    mug_mocks.establish_connection.return_value = mock_client
+    await ember_mug._ensure_connection()
 
-    mock_establish_connection.assert_called_once()
-    mock_logger.warning.assert_called_with(
+    mug_mocks.establish_connection.assert_called_once()
+    mug_mocks.logger.warning.assert_called_with(
         "Pairing not implemented. "
         "If your mug is still in pairing mode (blinking blue) tap the button on the bottom to exit.",
     )
 
 
-@patch("ember_mug.mug.establish_connection")
-async def test_pairing_exceptions(
-    mock_establish_connection: Mock,
-    ember_mug: MockMug,
-) -> None:
+async def test_pairing_exceptions(ember_mug: MockMug, mug_mocks: SimpleNamespace) -> None:
     mock_client = AsyncMock()
     mock_client.pair.side_effect = BleakError
-    mock_establish_connection.return_value = mock_client
-    with patch.multiple(
-        ember_mug,
-        update_initial=AsyncMock(),
-        subscribe=AsyncMock(),
-    ):
-        await ember_mug._ensure_connection()
+    mug_mocks.establish_connection.return_value = mock_client
+    await ember_mug._ensure_connection()
 
 
 async def test_disconnect(ember_mug: MockMug) -> None:
@@ -144,41 +206,34 @@ async def test_disconnect(ember_mug: MockMug) -> None:
     mock_client.disconnect.assert_called()
 
 
-@patch("ember_mug.mug.logger")
-def test_disconnect_callback(mock_logger: Mock, ember_mug: MockMug) -> None:
+def test_disconnect_callback(ember_mug: MockMug, mug_mocks: SimpleNamespace) -> None:
     ember_mug._expected_disconnect = True
     ember_mug._disconnect_callback(AsyncMock())
-    mock_logger.debug.assert_called_with("Disconnect callback called")
-    mock_logger.reset_mock()
+    mug_mocks.logger.debug.assert_called_with("Disconnect callback called")
+    mug_mocks.logger.reset_mock()
 
     ember_mug._expected_disconnect = False
     ember_mug._disconnect_callback(AsyncMock())
-    mock_logger.debug.assert_called_with("Unexpectedly disconnected")
+    mug_mocks.logger.debug.assert_called_with("Unexpectedly disconnected")
 
 
-@patch("ember_mug.mug.logger")
-async def test_read(
-    mock_logger: Mock,
-    ember_mug: MockMug,
-) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"TEST")
+async def test_read(ember_mug: MockMug, mug_mocks: SimpleNamespace) -> None:
+    with patch.object(ember_mug, "_ensure_connection", async_mock()):
+        ember_mug._client.read_gatt_char.return_value = b"TEST"
         await ember_mug._read(MugCharacteristic.MUG_NAME)
         ember_mug._client.read_gatt_char.assert_called_with(
             MugCharacteristic.MUG_NAME.uuid,
         )
-        mock_logger.debug.assert_called_with(
+        mug_mocks.logger.debug.assert_called_with(
             "Read attribute '%s' with value '%s'",
             MugCharacteristic.MUG_NAME,
             b"TEST",
         )
 
 
-@patch("ember_mug.mug.logger")
-async def test_write(mock_logger: Mock, ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
+async def test_write(ember_mug: MockMug, mug_mocks: SimpleNamespace) -> None:
+    with patch.object(ember_mug, "_ensure_connection", async_mock()):
         test_name = bytearray(b"TEST")
-        ember_mug._client.write_gatt_char = AsyncMock()
         await ember_mug._write(
             MugCharacteristic.MUG_NAME,
             test_name,
@@ -187,7 +242,7 @@ async def test_write(mock_logger: Mock, ember_mug: MockMug) -> None:
             MugCharacteristic.MUG_NAME.uuid,
             test_name,
         )
-        mock_logger.debug.assert_called_with(
+        mug_mocks.logger.debug.assert_called_with(
             "Wrote '%s' to attribute '%s'",
             test_name,
             MugCharacteristic.MUG_NAME,
@@ -204,7 +259,7 @@ async def test_write(mock_logger: Mock, ember_mug: MockMug) -> None:
             MugCharacteristic.MUG_NAME.uuid,
             test_name,
         )
-        msg, data, char, exception = mock_logger.error.mock_calls[0].args
+        msg, data, char, exception = mug_mocks.logger.error.mock_calls[0].args
         assert msg == "Failed to write '%s' to attribute '%s': %s"
         assert data == test_name
         assert char == MugCharacteristic.MUG_NAME
@@ -240,54 +295,79 @@ def test_has_attribute(ember_mug: MockMug) -> None:
     assert ember_mug.has_attribute("name") is True
 
 
-async def test_get_mug_meta(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"Yw====-ABCDEFGHIJ")
-        meta = await ember_mug.get_meta()
-        assert meta.mug_id == "WXc9PT09"
-        assert meta.serial_number == "ABCDEFGHIJ"
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.MUG_ID.uuid)
-
-
-async def test_get_mug_battery(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"5\x01")
-        battery = await ember_mug.get_battery()
-        assert battery.percent == 53.00
-        assert battery.on_charging_base is True
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.BATTERY.uuid)
-
-
-async def test_get_mug_led_colour(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"\xf4\x00\xa1\xff")
-        colour = await ember_mug.get_led_colour()
-        assert colour.as_hex() == "#f400a1"
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.LED.uuid)
+# Raw payloads reused across cases, constructed once at import
+TEMP_55_81_BYTES = b"\xcd\x15"  # int: 5581
+LED_COLOUR_BYTES = b"\xf4\x00\xa1\xff"
+LED_COLOUR_BYTEARRAY = bytearray(LED_COLOUR_BYTES)
+VOLUME_HIGH_PAYLOAD = bytearray(b"\x02")
+VOLUME_LOW_PAYLOAD = bytearray(b"\x00")
+
+# Simple single-read getters: (method name, raw bytes, expected result, characteristic)
+READ_CASES = [
+    ("get_meta", b"Yw====-ABCDEFGHIJ", MugMeta("WXc9PT09", "ABCDEFGHIJ"), MugCharacteristic.MUG_ID),
+    ("get_battery", b"5\x01", BatteryInfo(53.0, on_charging_base=True), MugCharacteristic.BATTERY),
+    ("get_led_colour", LED_COLOUR_BYTES, Colour(244, 0, 161, 255), MugCharacteristic.LED),
+    ("get_target_temp", TEMP_55_81_BYTES, 55.81, MugCharacteristic.TARGET_TEMPERATURE),
+    ("get_current_temp", TEMP_55_81_BYTES, 55.81, MugCharacteristic.CURRENT_TEMPERATURE),
+    ("get_liquid_level", b"\n", 10, MugCharacteristic.LIQUID_LEVEL),
+    ("get_liquid_state", b"\x06", LiquidState.TARGET_TEMPERATURE, MugCharacteristic.LIQUID_STATE),
+    ("get_name", b"Mug Name", "Mug Name", MugCharacteristic.MUG_NAME),
+    ("get_udsk", b"abcd12345", "YWJjZDEyMzQ1", MugCharacteristic.UDSK),
+    ("get_dsk", b"abcd12345", "YWJjZDEyMzQ1", MugCharacteristic.DSK),
+    ("get_dsk", b"something else", "c29tZXRoaW5nIGVsc2U=", MugCharacteristic.DSK),
+    ("get_temperature_unit", b"\x01", TemperatureUnit.FAHRENHEIT, MugCharacteristic.TEMPERATURE_UNIT),
+    ("get_temperature_unit", b"\x00", TemperatureUnit.CELSIUS, MugCharacteristic.TEMPERATURE_UNIT),
+    ("get_battery_voltage", b"\x01", 1, MugCharacteristic.CONTROL_REGISTER_DATA),
+    ("get_date_time_zone", b"c\x0f\xf6\x00", datetime(2022, 9, 1, tzinfo=UTC), MugCharacteristic.DATE_TIME_AND_ZONE),
+    ("get_firmware", b"c\x01\x80\x00\x12\x00", MugFirmwareInfo(355, 128, 18), MugCharacteristic.FIRMWARE),
+]
+
+# Simple single-write setters: (method name, value, characteristic, expected payload)
+WRITE_CASES = [
+    ("set_led_colour", Colour(244, 0, 161), MugCharacteristic.LED, LED_COLOUR_BYTEARRAY),
+    ("set_name", "Mug name", MugCharacteristic.MUG_NAME, bytearray(b"Mug name")),
+    ("set_udsk", "abcd12345", MugCharacteristic.UDSK, bytearray(b"YWJjZDEyMzQ1")),
+    ("set_temperature_unit", TemperatureUnit.CELSIUS, MugCharacteristic.TEMPERATURE_UNIT, bytearray(b"\x00")),
+]
+
+
+@pytest.mark.parametrize(("method_name", "raw_bytes", "expected", "characteristic"), READ_CASES)
+async def test_get_characteristics(
+    ember_mug: MockMug,
+    method_name: str,
+    raw_bytes: bytes,
+    expected: Any,
+    characteristic: MugCharacteristic,
+) -> None:
+    ember_mug._client.read_gatt_char.return_value = raw_bytes
+    assert (await getattr(ember_mug, method_name)()) == expected
+    ember_mug._client.read_gatt_char.assert_called_once_with(characteristic.uuid)
 
 
-async def test_set_mug_led_colour(ember_mug: MockMug) -> None:
-    mock_ensure_connection = AsyncMock()
-    ember_mug._client.write_gatt_char = AsyncMock()
+@pytest.mark.parametrize(("method_name", "value", "characteristic", "payload"), WRITE_CASES)
+async def test_set_characteristics(
+    ember_mug: MockMug,
+    method_name: str,
+    value: Any,
+    characteristic: MugCharacteristic,
+    payload: bytearray,
+) -> None:
+    mock_ensure_connection = async_mock()
     with patch.object(ember_mug, "_ensure_connection", mock_ensure_connection):
-        await ember_mug.set_led_colour(Colour(244, 0, 161))
+        await getattr(ember_mug, method_name)(value)
         mock_ensure_connection.assert_called_once()
-        ember_mug._client.write_gatt_char.assert_called_once_with(
-            MugCharacteristic.LED.uuid,
-            bytearray(b"\xf4\x00\xa1\xff"),
-        )
+        ember_mug._client.write_gatt_char.assert_called_once_with(characteristic.uuid, payload)
 
 
 async def test_set_volume_level_travel_mug(ember_mug: MockMug) -> None:
     ember_mug.data.model_info.model = DeviceModel.TRAVEL_MUG_12_OZ
-    mock_ensure_connection = AsyncMock()
-    ember_mug._client.write_gatt_char = AsyncMock()
+    mock_ensure_connection = async_mock()
     with patch.object(ember_mug, "_ensure_connection", mock_ensure_connection):
         await ember_mug.set_volume_level(VolumeLevel.HIGH)
         mock_ensure_connection.assert_called_once()
         ember_mug._client.write_gatt_char.assert_called_once_with(
             MugCharacteristic.VOLUME.uuid,
-            bytearray(b"\02"),
+            VOLUME_HIGH_PAYLOAD,
         )
         mock_ensure_connection.reset_mock()
         ember_mug._client.write_gatt_char.reset_mock()
@@ -296,12 +376,12 @@ async def test_set_volume_level_travel_mug(ember_mug: MockMug) -> None:
         mock_ensure_connection.assert_called_once()
         ember_mug._client.write_gatt_char.assert_called_once_with(
             MugCharacteristic.VOLUME.uuid,
-            bytearray(b"\00"),
+            VOLUME_LOW_PAYLOAD,
         )
 
 
 async def test_set_volume_level_mug(ember_mug: MockMug) -> None:
-    mock_ensure_connection = AsyncMock()
+    mock_ensure_connection = async_mock()
     with patch.object(ember_mug, "_ensure_connection", mock_ensure_connection):
         error = "The mug does not have the volume_level attribute"
         with pytest.raises(NotImplementedError, match=error):
@@ -310,16 +390,8 @@ async def test_set_volume_level_mug(ember_mug: MockMug) -> None:
         ember_mug._client.write_gatt_char.assert_not_called()
 
 
-async def test_get_mug_target_temp(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"\xcd\x15")
-        assert (await ember_mug.get_target_temp()) == 55.81
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.TARGET_TEMPERATURE.uuid)
-
-
 async def test_set_mug_target_temp_celsius(ember_mug: MockMug) -> None:
-    mock_ensure_connection = AsyncMock()
-    ember_mug._client.write_gatt_char = AsyncMock()
+    mock_ensure_connection = async_mock()
     error = "Temperature should be between 49 and 63 or 0."
     with pytest.raises(ValueError, match=error):
         await ember_mug.set_target_temp(10)
@@ -332,13 +404,12 @@ async def test_set_mug_target_temp_celsius(ember_mug: MockMug) -> None:
         mock_ensure_connection.assert_called_once()
         ember_mug._client.write_gatt_char.assert_called_once_with(
             MugCharacteristic.TARGET_TEMPERATURE.uuid,
-            bytearray(b"\xcd\x15"),
+            bytearray(TEMP_55_81_BYTES),
         )
 
 
 async def test_set_mug_target_temp_fahrenheit(ember_mug: MockMug) -> None:
-    mock_ensure_connection = AsyncMock()
-    ember_mug._client.write_gatt_char = AsyncMock()
+    mock_ensure_connection = async_mock()
     ember_mug.data.use_metric = False
     error = "Temperature should be between 120 and 145 or 0."
 
@@ -357,165 +428,58 @@ async def test_set_mug_target_temp_fahrenheit(ember_mug: MockMug) -> None:
         )
 
 
-async def test_get_mug_current_temp(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"\xcd\x15")
-        assert (await ember_mug.get_current_temp()) == 55.81
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.CURRENT_TEMPERATURE.uuid)
-
-
-async def test_get_mug_liquid_level(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"\n")
-        assert (await ember_mug.get_liquid_level()) == 10
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.LIQUID_LEVEL.uuid)
-
-
-async def test_get_mug_liquid_state(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"\x06")
-        assert (await ember_mug.get_liquid_state()) == 6
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.LIQUID_STATE.uuid)
+async def test_get_mug_name_unsupported(ember_mug: MockMug) -> None:
+    ember_mug.data.model_info = ModelInfo(DeviceModel.CUP_6_OZ)
+    with pytest.raises(NotImplementedError):
+        await ember_mug.get_name()
 
 
-async def test_get_mug_name(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"Mug Name")
-        assert (await ember_mug.get_name()) == "Mug Name"
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.MUG_NAME.uuid)
-
-        ember_mug.data.model_info = ModelInfo(DeviceModel.CUP_6_OZ)
-        with pytest.raises(NotImplementedError):
-            await ember_mug.get_name()
-
-
-async def test_set_mug_name(ember_mug: MockMug) -> None:
+async def test_set_mug_name_errors(ember_mug: MockMug) -> None:
     invalid_name = "Name cannot contain any special characters and must be 16 characters or less"
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()), pytest.raises(ValueError, match=invalid_name):
+    with patch.object(ember_mug, "_ensure_connection", async_mock()), pytest.raises(ValueError, match=invalid_name):
         await ember_mug.set_name("Hé!")
 
-    mock_ensure_connection = AsyncMock()
-    ember_mug._client.write_gatt_char = AsyncMock()
-    with patch.object(ember_mug, "_ensure_connection", mock_ensure_connection):
-        await ember_mug.set_name("Mug name")
-        mock_ensure_connection.assert_called()
-        ember_mug._client.write_gatt_char.assert_called_once_with(
-            MugCharacteristic.MUG_NAME.uuid,
-            bytearray(b"Mug name"),
-        )
-
-        ember_mug.data.model_info = ModelInfo(DeviceModel.CUP_6_OZ)
-        error = "The cup does not have the name attribute"
-        with pytest.raises(NotImplementedError, match=error):
-            await ember_mug.set_name("Test")
-
-
-async def test_get_mug_udsk(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"abcd12345")
-        assert (await ember_mug.get_udsk()) == "YWJjZDEyMzQ1"
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.UDSK.uuid)
-
-
-async def test_set_mug_udsk(ember_mug: MockMug) -> None:
-    mock_ensure_connection = AsyncMock()
-    ember_mug._client.write_gatt_char = AsyncMock()
-    with patch.object(ember_mug, "_ensure_connection", mock_ensure_connection):
-        await ember_mug.set_udsk("abcd12345")
-        mock_ensure_connection.assert_called_once()
-        ember_mug._client.write_gatt_char.assert_called_once_with(
-            MugCharacteristic.UDSK.uuid,
-            bytearray(b"YWJjZDEyMzQ1"),
-        )
-
-
-async def test_get_mug_dsk(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"abcd12345")
-        assert (await ember_mug.get_dsk()) == "YWJjZDEyMzQ1"
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"something else")
-        assert (await ember_mug.get_dsk()) == "c29tZXRoaW5nIGVsc2U="
-        ember_mug._client.read_gatt_char.assert_called_with(MugCharacteristic.DSK.uuid)
-
-
-async def test_get_mug_temperature_unit(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"\x01")
-        assert (await ember_mug.get_temperature_unit()) == TemperatureUnit.FAHRENHEIT
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.TEMPERATURE_UNIT.uuid)
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"\x00")
-        assert (await ember_mug.get_temperature_unit()) == TemperatureUnit.CELSIUS
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.TEMPERATURE_UNIT.uuid)
-
-
-async def test_set_mug_temperature_unit(ember_mug: MockMug) -> None:
-    mock_ensure_connection = AsyncMock()
-    ember_mug._client.write_gatt_char = AsyncMock()
-    with patch.object(ember_mug, "_ensure_connection", mock_ensure_connection):
-        await ember_mug.set_temperature_unit(TemperatureUnit.CELSIUS)
-        mock_ensure_connection.assert_called_once()
-        ember_mug._client.write_gatt_char.assert_called_once_with(
-            MugCharacteristic.TEMPERATURE_UNIT.uuid,
-            bytearray(b"\x00"),
-        )
+    ember_mug.data.model_info = ModelInfo(DeviceModel.CUP_6_OZ)
+    error = "The cup does not have the name attribute"
+    with pytest.raises(NotImplementedError, match=error):
+        await ember_mug.set_name("Test")
 
 
 async def test_mug_ensure_correct_unit(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
+    with patch.object(ember_mug, "_ensure_connection", async_mock()):
         ember_mug.data.temperature_unit = TemperatureUnit.CELSIUS
         ember_mug.data.use_metric = True
-        mock_set_temp = AsyncMock(return_value=None)
+        mock_set_temp = async_mock()
         with patch.object(ember_mug, "set_temperature_unit", mock_set_temp):
             await ember_mug.ensure_correct_unit()
             mock_set_temp.assert_not_called()
+
             ember_mug.data.temperature_unit = TemperatureUnit.FAHRENHEIT
             await ember_mug.ensure_correct_unit()
             mock_set_temp.assert_called_with(TemperatureUnit.CELSIUS)
 
 
-async def test_get_mug_battery_voltage(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"\x01")
-        assert (await ember_mug.get_battery_voltage()) == 1
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.CONTROL_REGISTER_DATA.uuid)
+# Install the update stubs once for the tests that only assert call args
+@pytest.fixture
+def update_stub(ember_mug: MockMug) -> Generator[Mock, None, None]:
+    stub = async_mock({})
+    with patch.multiple(ember_mug, _ensure_connection=async_mock(), _update_multiple=stub):
+        yield stub
 
 
-async def test_get_mug_date_time_zone(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"c\x0f\xf6\x00")
-        date_time = await ember_mug.get_date_time_zone()
-        assert isinstance(date_time, datetime)
-        assert date_time.timestamp() == 1661990400.0
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.DATE_TIME_AND_ZONE.uuid)
+async def test_mug_update_initial(ember_mug: MockMug, update_stub: Mock) -> None:
+    ember_mug.data.model_info = ModelInfo()
+    assert (await ember_mug.update_initial()) == {}
+    update_stub.assert_called_once_with(INITIAL_ATTRS)
 
 
-async def test_read_firmware(ember_mug: MockMug) -> None:
-    with patch.object(ember_mug, "_ensure_connection", AsyncMock()):
-        ember_mug._client.read_gatt_char = AsyncMock(return_value=b"c\x01\x80\x00\x12\x00")
-        firmware = await ember_mug.get_firmware()
-        assert firmware.version == 355
-        assert firmware.hardware == 128
-        assert firmware.bootloader == 18
-        ember_mug._client.read_gatt_char.assert_called_once_with(MugCharacteristic.FIRMWARE.uuid)
-
-
-async def test_mug_update_initial(ember_mug: MockMug) -> None:
-    mock_update = AsyncMock(return_value={})
-    with patch.multiple(ember_mug, _ensure_connection=AsyncMock(), _update_multiple=mock_update):
-        ember_mug.data.model_info = ModelInfo()
-        assert (await ember_mug.update_initial()) == {}
-        mock_update.assert_called_once_with(INITIAL_ATTRS)
-
-
-async def test_mug_update_all(ember_mug: MockMug) -> None:
-    mock_update = AsyncMock(return_value={})
-    with patch.multiple(ember_mug, _ensure_connection=AsyncMock(), _update_multiple=mock_update):
-        assert (await ember_mug.update_all()) == {}
-        mock_update.assert_called_once_with(UPDATE_ATTRS)
+async def test_mug_update_all(ember_mug: MockMug, update_stub: Mock) -> None:
+    assert (await ember_mug.update_all()) == {}
+    update_stub.assert_called_once_with(UPDATE_ATTRS)
 
 
 async def test_mug_update_multiple(ember_mug: MockMug) -> None:
-    mock_get_name = AsyncMock(return_value="name")
+    mock_get_name = async_mock("name")
 
     with (
         patch.multiple(ember_mug, get_name=mock_get_name),
@@ -527,32 +491,44 @@ async def test_mug_update_multiple(ember_mug: MockMug) -> None:
 
 
 async def test_mug_update_queued_attributes(ember_mug: MockMug) -> None:
-    mock_get_name = AsyncMock(return_value="name")
+    mock_get_battery = async_mock(BatteryInfo(percent=50, on_charging_base=True))
 
-    with patch.multiple(ember_mug, get_name=mock_get_name):
-        ember_mug._queued_updates = set()
-        assert (await ember_mug.update_queued_attributes()) == []
+    with patch.multiple(ember_mug, get_battery=mock_get_battery):
+        assert not await ember_mug.update_queued_attributes()
         with patch.object(ember_mug.data, "update_info") as mock_update_info:
-            ember_mug._queued_updates = {"name"}
+            ember_mug._queued_updates = UpdateAttribute.BATTERY
             await ember_mug.update_queued_attributes()
-            mock_update_info.assert_called_once_with(name="name")
+            mock_update_info.assert_called_once_with(battery=BatteryInfo(percent=50, on_charging_base=True))
+            assert not ember_mug._queued_updates
+
+
+@pytest.mark.parametrize(
+    ("event_byte", "queued_attr"),
+    [
+        (1, "battery"),
+        (3, "battery"),
+        (4, "target_temp"),
+        (5, "current_temp"),
+        (7, "liquid_level"),
+        (8, "liquid_state"),
+        (9, "battery_voltage"),
+    ],
+)
+def test_mug_notify_callback_queues_update(ember_mug: MockMug, event_byte: int, queued_attr: str) -> None:
+    ember_mug._notify_callback(Mock(), bytearray([event_byte]))
+    assert ember_mug._latest_events[event_byte]
+    assert UpdateAttribute[queued_attr.upper()] & ember_mug._queued_updates
 
 
-def test_mug_notify_callback(ember_mug: MockMug) -> None:
-    gatt_char = AsyncMock()
-    ember_mug._notify_callback(gatt_char, bytearray(b"\x01"))
-    ember_mug._notify_callback(gatt_char, bytearray(b"\x02"))
-    assert 2 in ember_mug._latest_events
-    ember_mug._notify_callback(gatt_char, bytearray(b"\x04"))
-    assert 4 in ember_mug._latest_events
-    ember_mug._notify_callback(gatt_char, bytearray(b"\x05"))
-    assert 5 in ember_mug._latest_events
-    ember_mug._notify_callback(gatt_char, bytearray(b"\x06"))
-    assert 6 in ember_mug._latest_events
-    ember_mug._notify_callback(gatt_char, bytearray(b"\x07"))
-    assert 7 in ember_mug._latest_events
-    ember_mug._notify_callback(gatt_char, bytearray(b"\x08"))
-    assert 8 in ember_mug._latest_events
+def test_mug_notify_callback_auth_info_missing(ember_mug: MockMug, mug_mocks: SimpleNamespace) -> None:
+    ember_mug._notify_callback(Mock(), bytearray(b"\x06"))
+    assert ember_mug._latest_events[6]
+    mug_mocks.logger.warning.assert_called_once_with("Auth info missing")
+    assert not ember_mug._queued_updates
+
+
+def test_mug_notify_callback_dedup_and_unregister(ember_mug: MockMug) -> None:
+    gatt_char = Mock()
     callback = Mock()
     second_callback = Mock()
     unregister = ember_mug.register_callback(callback)
@@ -560,23 +536,13 @@ def test_mug_notify_callback(ember_mug: MockMug) -> None:
     repeat_unregister = ember_mug.register_callback(callback)
     assert unregister is repeat_unregister
     assert unregister is not second_unregister
-
     assert callback in ember_mug._callbacks
-    ember_mug._notify_callback(gatt_char, bytearray(b"\x09"))
-    assert 9 in ember_mug._latest_events
-    callback.assert_not_called()
-    assert ember_mug._queued_updates == {
-        "battery",
-        "target_temp",
-        "current_temp",
-        "liquid_level",
-        "liquid_state",
-        "battery_voltage",
-    }
-    ember_mug._latest_events = {}
+
     ember_mug._notify_callback(gatt_char, bytearray(b"\x02"))
     callback.assert_called_once()
+    assert ember_mug._queued_updates == UpdateAttribute.BATTERY
     callback.reset_mock()
+    # Repeated events within the debounce window are ignored
     ember_mug._notify_callback(gatt_char, bytearray(b"\x02"))
     callback.assert_not_called()
     # Remove callback
@@ -65,6 +65,17 @@ def test_mug_formatting(mug_data: MugData) -> None:
     assert mug_data.formatted == basic_info
 
 
+def test_formatted_cached(mug_data: MugData) -> None:
+    first = mug_data.formatted
+    assert mug_data.formatted is first
+    mug_data.update_info(liquid_level=7)
+    assert mug_data.formatted is not first
+    mug_data.model_info = ModelInfo(DeviceModel.MUG_2_10_OZ)
+    second = mug_data.formatted
+    mug_data.model_info.model = DeviceModel.MUG_2_14_OZ
+    assert mug_data.formatted is not second
+
+
 def test_update_info(mug_data: MugData) -> None:
     mug_data.current_temp = 55
     mug_data.target_temp = 55
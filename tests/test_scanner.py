@@ -1,6 +1,6 @@
 """Tests for scanner."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 from bleak.backends.device import BLEDevice
@@ -43,6 +43,33 @@ async def test_discover_devices(mock_scanner: AsyncMock, mock_sleep: AsyncMock)
     mock_sleep.assert_called_with(5)
 
 
+@patch("asyncio.sleep")
+@patch("ember_mug.scanner.BleakScanner")
+async def test_discover_devices_stops_polling_when_found(mock_scanner: AsyncMock, mock_sleep: AsyncMock) -> None:
+    scanner = mock_scanner.return_value.__aenter__.return_value
+    found = {m.address: (m, TEST_MUG_ADVERTISEMENT) for m in EXAMPLE_MUGS}
+    type(scanner).discovered_devices_and_advertisement_data = PropertyMock(side_effect=[{}, {}, found, found])
+    devices = await discover_devices(mac=MUG_1.address)
+    assert devices == [(MUG_1, TEST_MUG_ADVERTISEMENT)]
+    # Only polled until the device appeared, never the full window
+    assert mock_sleep.call_count == 2
+    mock_sleep.assert_called_with(1)
+
+
+@patch("asyncio.sleep")
+@patch("ember_mug.scanner.BleakScanner")
+async def test_discover_devices_falls_back_to_scanning_all(mock_scanner: AsyncMock, mock_sleep: AsyncMock) -> None:
+    scanner = mock_scanner.return_value.__aenter__.return_value
+    # Keyed by something other than the address, so both direct lookups miss
+    not_by_address = {f"path-{i}": (m, TEST_MUG_ADVERTISEMENT) for i, m in enumerate(EXAMPLE_MUGS)}
+    type(scanner).discovered_devices_and_advertisement_data = PropertyMock(return_value=not_by_address)
+    devices = await discover_devices(mac=MUG_1.address)
+    assert devices == [(MUG_1, TEST_MUG_ADVERTISEMENT)]
+    # The full wait budget was used before filtering by address
+    assert mock_sleep.call_count == 5
+    mock_sleep.assert_called_with(1)
+
+
 @patch("asyncio.sleep")
 @patch("ember_mug.scanner.BleakScanner")
 async def test_find_device(mock_scanner: AsyncMock, mock_sleep: AsyncMock) -> None: